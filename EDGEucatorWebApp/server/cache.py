@@ -0,0 +1,163 @@
+"""
+cache.py
+--------
+Semantic reply cache in front of Gemini for /chat.
+
+Each answered prompt's reply text is stored with a sentence embedding of the
+user text. A new prompt whose embedding is close enough (cosine similarity ≥
+threshold) to a stored one in the same namespace is answered from the cache,
+skipping the Gemini call. The namespace should identify everything that
+shapes the reply (model, persona prompt) so changing either starts afresh.
+Audio is not stored here — main.py voices the cached reply through
+tts_cache.py, which is keyed on voice and TTS model.
+
+Backed by sqlite3 + the sqlite-vec extension; embeddings come from a small
+local sentence-transformers model. Both are optional (requirements-cache.txt)
+— without them, or if either fails to load, the cache stays disabled and
+/chat behaves exactly as before.
+
+Usage (wired up by main.py):
+    chat_cache = SemanticCache(db_path="chat_cache.sqlite3")
+    chat_cache.open()                                   # slow: loads the model
+    reply, emb = chat_cache.lookup(user_text, namespace)
+    if reply is None:
+        ...
+        chat_cache.store(emb, user_text, namespace, reply)
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlite_vec
+    from sentence_transformers import SentenceTransformer
+    _HAS_DEPS = True
+except ImportError:
+    _HAS_DEPS = False
+
+
+_SCHEMA = """
+DROP TABLE IF EXISTS chat_cache;  -- old layout that also stored audio
+CREATE TABLE IF NOT EXISTS chat_replies (
+    id        INTEGER PRIMARY KEY,
+    namespace TEXT    NOT NULL,
+    embedding BLOB    NOT NULL,   -- float32[dim], L2-normalised
+    user_text TEXT    NOT NULL,
+    reply     TEXT    NOT NULL,
+    ts        INTEGER NOT NULL    -- unix seconds, for TTL
+);
+CREATE INDEX IF NOT EXISTS chat_replies_ns_ts ON chat_replies (namespace, ts);
+"""
+
+
+class SemanticCache:
+    """
+    Parameters
+    ----------
+    db_path    : SQLite file to keep cached replies in.
+    model_name : sentence-transformers model used to embed prompts.
+    threshold  : Minimum cosine similarity for a hit.
+    ttl_s      : Entries older than this are ignored and eventually deleted.
+    """
+
+    def __init__(
+        self,
+        db_path:    str,
+        model_name: str   = "sentence-transformers/all-MiniLM-L6-v2",
+        threshold:  float = 0.93,
+        ttl_s:      int   = 24 * 3600,
+    ) -> None:
+        self.db_path    = db_path
+        self.model_name = model_name
+        self.threshold  = threshold
+        self.ttl_s      = ttl_s
+        self._model     = None
+        self._conn: sqlite3.Connection | None = None
+        self._lock      = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    def open(self) -> None:
+        """Load the embedder and open the database. Blocking — run off the loop."""
+        if not _HAS_DEPS:
+            logger.warning(
+                "[cache] Semantic cache disabled — "
+                "run: pip install -r requirements-cache.txt"
+            )
+            return
+        conn = None
+        try:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.enable_load_extension(True)
+            sqlite_vec.load(conn)
+            conn.enable_load_extension(False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._model = SentenceTransformer(self.model_name)
+        except Exception:
+            # Anything from "sqlite3 can't load extensions" to a failed model
+            # download — the cache is optional, so never block startup on it
+            logger.exception("[cache] Semantic cache disabled — failed to initialise")
+            if conn is not None:
+                conn.close()
+            self._model = None
+            return
+        self._conn = conn
+        logger.info(f"[cache] Semantic cache ready ({self.db_path})")
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
+
+    # ── Lookup / store ────────────────────────────────────────────────────────
+
+    def _embed(self, text: str) -> bytes:
+        vec = self._model.encode(text, normalize_embeddings=True)
+        return vec.astype("float32").tobytes()
+
+    def lookup(self, text: str, namespace: str) -> tuple[str | None, bytes | None]:
+        """
+        Return (cached reply | None, embedding). Pass the embedding back to
+        ``store`` on a miss so the prompt isn't embedded twice. Blocking.
+        """
+        if not self.enabled:
+            return None, None
+
+        emb = self._embed(text)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT reply, vec_distance_cosine(embedding, ?) AS d "
+                "FROM chat_replies WHERE namespace = ? AND ts >= ? "
+                "ORDER BY d LIMIT 1",
+                (emb, namespace, int(time.time()) - self.ttl_s),
+            ).fetchone()
+
+        if row is None or 1.0 - row[1] < self.threshold:
+            return None, emb
+
+        logger.info(f"[cache] Hit (similarity {1.0 - row[1]:.3f})")
+        return row[0], emb
+
+    def store(self, emb: bytes | None, text: str, namespace: str, reply: str) -> None:
+        """Insert a fresh reply and drop expired rows. Blocking."""
+        if not self.enabled or emb is None:
+            return
+
+        now = int(time.time())
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO chat_replies (namespace, embedding, user_text, reply, ts) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (namespace, emb, text, reply, now),
+            )
+            self._conn.execute("DELETE FROM chat_replies WHERE ts < ?", (now - self.ttl_s,))
@@ -5,24 +5,21 @@ gesture_server.py
 Webcam gesture recognition → WebSocket camera-update stream.
 
 Reads the webcam with OpenCV, runs MediaPipe Tasks GestureRecognizer, then
-broadcasts compact JSON delta packets to the React frontend over WebSocket so
+broadcasts compact binary delta packets to the React frontend over WebSocket so
 the browser can update its camera without touching the MediaPipe JS library.
 
   WebSocket : ws://localhost:8765
 
-  Packet format:
-    {
-      "active":     bool,          # hand visible and confirmed
-      "gesture":    str,           # raw MediaPipe gesture name
-      "confidence": float,         # 0.0 – 1.0
-      "mode":       str,           # PAN | ZOOM | ROTATE_H | ROTATE_V | RESET | NONE
-      "dPanX":      float,         # add to current panX
-      "dPanY":      float,         # add to current panY
-      "dTheta":     float,         # add to current thetaDeg
-      "dPhi":       float,         # add to current phiDeg
-      "dRadius":    float,         # add to current radius
-      "reset":      bool           # true → restore camera defaults
-    }
+  Packet format (14-byte little-endian binary frame, see PACKET):
+    u8   mode          # index into MODES
+    u8   gesture       # index into GESTURES (raw MediaPipe gesture name)
+    u8   flags         # bit 0: active (hand visible), bit 1: reset camera
+    i16  dPanX   ×1e4  # add to current panX
+    i16  dPanY   ×1e4  # add to current panY
+    i16  dTheta  ×1e2  # add to current thetaDeg
+    i16  dPhi    ×1e2  # add to current phiDeg
+    i16  dRadius ×1e4  # add to current radius
+    u8   confidence ×255
 
 Improvements over the JS version
   1. One Euro Filter  — adaptive smoothing: no jitter when still, no lag when
@@ -32,6 +29,24 @@ Improvements over the JS version
   3. Relative Delta   — pan/rotate use frame-to-frame position deltas, giving
                         1:1 hand-movement feel regardless of start position.
   4. Snap constants   — GESTURE_CONFIRM_FRAMES=2 for near-instant mode switching.
+  5. GPU delegate     — MediaPipe inference runs on the GPU when available and
+                        falls back to the XNNPACK CPU delegate otherwise.
+
+GPU delegate
+  On Linux the GPU delegate needs a working EGL / OpenGL ES 3.1+ driver
+  (e.g. libegl1 + libgles2 on Debian/Ubuntu, or the vendor driver). Headless
+  boxes without one log a warning and run on the CPU. Set GESTURE_DELEGATE=cpu
+  to skip the GPU attempt entirely.
+  Frames still enter as CPU images: the Python Tasks API has no GpuBuffer /
+  GL-texture input (that needs a C++ graph, cf. demo_run_graph_main_gpu.cc),
+  so the delegate uploads each frame itself. Keeping frames small (FRAME_W ×
+  FRAME_H) is what keeps that upload cheap.
+
+Camera latency
+  The capture buffer is shrunk to a single frame so reads never return stale
+  frames. On Jetson / Raspberry Pi, set GESTURE_GST_PIPELINE to a GStreamer
+  pipeline for guaranteed 1-frame latency, e.g.
+    v4l2src ! video/x-raw,framerate=60/1 ! videoconvert ! appsink drop=1 max-buffers=1
 
 Run:
     pip install mediapipe opencv-python websockets
@@ -39,8 +54,11 @@ Run:
 """
 
 import asyncio
-import json
 import math
+import os
+import socket
+import struct
+import sys
 import threading
 import time
 import urllib.request
@@ -48,7 +66,17 @@ from pathlib import Path
 from typing import Optional
 
 import cv2
+import mediapipe as mp
+import numpy as np
 import websockets
+from mediapipe.tasks import python as mp_python
+from mediapipe.tasks.python import vision as mp_vision
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional — fall back to plain Python
+    def njit(*_args, **_kwargs):
+        return lambda fn: fn
 
 # ── Model auto-download ───────────────────────────────────────────────────────
 MODEL_URL  = (
@@ -58,11 +86,18 @@ MODEL_URL  = (
 MODEL_PATH = Path(__file__).parent / "gesture_recognizer.task"
 
 
+_model_ready = False
+
+
 def ensure_model() -> None:
+    global _model_ready
+    if _model_ready:
+        return
     if not MODEL_PATH.exists():
         print(f"[gesture] Downloading model → {MODEL_PATH} …")
         urllib.request.urlretrieve(MODEL_URL, MODEL_PATH)
         print("[gesture] Download complete.")
+    _model_ready = True
 
 
 # ── Tunable constants (edit freely) ──────────────────────────────────────────
@@ -79,12 +114,16 @@ S = {
     # Rotation V: normalised vertical delta × ROT_V = phi delta (deg)
     "ROT_V_SENSITIVITY":      180.0,
 
-    # Landmark smoothing — see OneEuroFilter class below.
+    # Landmark smoothing — see VectorOneEuro below.
     # These control the One Euro Filter (not a plain LERP).
     "OEF_MIN_CUTOFF":         1.0,   # Hz — lower = smoother when still
     "OEF_BETA":               0.07,  # higher = more responsive when fast
     "OEF_D_CUTOFF":           1.0,   # Hz — derivative filter cutoff
 
+    # Output smoothing — a second, lighter One Euro stage on the camera deltas
+    "OUT_OEF_MIN_CUTOFF":     2.0,   # Hz
+    "OUT_OEF_BETA":           0.02,
+
     # Frames a gesture must be held before it activates (lower = snappier)
     "GESTURE_CONFIRM_FRAMES": 2,
 
@@ -102,6 +141,11 @@ S = {
 
     # Thumb zoom: radius units added/subtracted per frame while gesture is held
     "THUMB_ZOOM_SPEED":       0.08,  # increase for faster zoom
+
+    # Idle duty cycle: after this many hand-less frames, run detection at
+    # ~10 FPS instead of camera rate until a hand shows up again
+    "IDLE_AFTER_FRAMES":      30,
+    "IDLE_FRAME_INTERVAL_S":  0.09,
 }
 
 # Camera reset targets (must match GESTURE_DEFAULTS in gestureTypes.ts)
@@ -117,16 +161,72 @@ GESTURE_MAP: dict[str, str] = {
     "Closed_Fist": "RESET",
 }
 
+# ── Wire format (must match GestureController.tsx) ───────────────────────────
+MODES    = ("NONE", "PAN", "ZOOM_IN", "ZOOM_OUT", "ROTATE_H", "ROTATE_V", "RESET")
+GESTURES = (
+    "None", "Closed_Fist", "Open_Palm", "Pointing_Up",
+    "Thumb_Down", "Thumb_Up", "Victory", "ILoveYou",
+)
+MODE_IDS    = {m: i for i, m in enumerate(MODES)}
+GESTURE_IDS = {g: i for i, g in enumerate(GESTURES)}
+
+PACKET      = struct.Struct("<BBBhhhhhB")
+FLAG_ACTIVE = 0x01
+FLAG_RESET  = 0x02
+LINEAR_SCALE = 10000.0  # dPanX / dPanY / dRadius
+ANGLE_SCALE  = 100.0    # dTheta / dPhi
+
 WS_HOST = "localhost"
 WS_PORT = 8765
 
+# "gpu" (default, falls back to CPU on failure) or "cpu"
+DELEGATE = os.getenv("GESTURE_DELEGATE", "gpu").lower()
+
+# Optional GStreamer pipeline string; overrides the default webcam when set
+GST_PIPELINE = os.getenv("GESTURE_GST_PIPELINE", "")
+
+# How long the broadcaster waits on one client's send before moving on.
+# ws.send() has already buffered the frame by then, so it still arrives later —
+# this bounds the wait for a slow client, it doesn't drop the frame.
+SEND_TIMEOUT_S = 0.05
+
+# Inference resolution — palm detection is just as reliable at 320×240 and it
+# moves 4× fewer bytes through colour conversion and MediaPipe preprocessing.
+FRAME_W = 320
+FRAME_H = 240
+
 
 # ── One Euro Filter ───────────────────────────────────────────────────────────
-class OneEuroFilter:
+_INV_2PI = 1.0 / (2.0 * math.pi)
+
+
+@njit(cache=True, fastmath=True)
+def oef_step_vec(xs, t, x, dx, prev_t, min_cutoff, beta, d_cutoff):
+    """
+    One One-Euro update across N lanes sharing one timestamp; updates x / dx
+    in place. JIT-compiled when numba is installed.
+    """
+    dt = max(t - prev_t, 1e-6)
+
+    # Smooth derivative — alpha = 1 / (1 + tau/dt) with tau = 1 / (2π·cutoff)
+    a_d   = dt / (dt + _INV_2PI / d_cutoff)
+    dx[:] = a_d * (xs - x) / dt + (1.0 - a_d) * dx
+
+    # Adaptive cutoff — faster movement → higher cutoff → less smoothing
+    cutoff = min_cutoff + beta * np.abs(dx)
+    a      = dt / (dt + _INV_2PI / cutoff)
+    x[:]   = a * xs + (1.0 - a) * x
+    return x
+
+
+class VectorOneEuro:
     """
     Casiez et al. 2012 — adaptive low-pass filter.
     Stays rock-steady when your hand is still; instantly tracks fast motion.
 
+    N independent filters stepped together (struct-of-arrays state); all lanes
+    share the same parameters and timestamp.
+
     min_cutoff  (Hz)  lower  → smoother when still
     beta               higher → more responsive when fast
     d_cutoff    (Hz)  cutoff for the internal derivative smoother
@@ -134,6 +234,7 @@ class OneEuroFilter:
 
     def __init__(
         self,
+        n: int,
         min_cutoff: float = 1.0,
         beta: float = 0.07,
         d_cutoff: float = 1.0,
@@ -141,40 +242,25 @@ class OneEuroFilter:
         self.min_cutoff = min_cutoff
         self.beta       = beta
         self.d_cutoff   = d_cutoff
-        self._x:  Optional[float] = None
-        self._dx: float           = 0.0
-        self._t:  Optional[float] = None
-
-    @staticmethod
-    def _alpha(cutoff: float, dt: float) -> float:
-        tau = 1.0 / (2.0 * math.pi * cutoff)
-        return 1.0 / (1.0 + tau / dt)
+        self.x  = np.zeros(n)
+        self.dx = np.zeros(n)
+        self.t: Optional[float] = None
 
     def reset(self) -> None:
-        self._x = self._t = None
-        self._dx = 0.0
-
-    def __call__(self, x: float, t: float) -> float:
-        if self._x is None:
-            self._x, self._t = x, t
-            return x
-
-        dt = max(t - self._t, 1e-6)
+        self.t = None
+        self.dx[:] = 0.0
 
-        # Smooth derivative
-        dx     = (x - self._x) / dt
-        a_d    = self._alpha(self.d_cutoff, dt)
-        dx_hat = a_d * dx + (1.0 - a_d) * self._dx
-
-        # Adaptive cutoff — faster movement → higher cutoff → less smoothing
-        cutoff = self.min_cutoff + self.beta * abs(dx_hat)
-        a      = self._alpha(cutoff, dt)
-        x_hat  = a * x + (1.0 - a) * self._x
-
-        self._x  = x_hat
-        self._dx = dx_hat
-        self._t  = t
-        return x_hat
+    def step(self, xs: np.ndarray, t: float) -> np.ndarray:
+        """Filter one sample per lane. Returns the internal state — unpack, don't keep."""
+        if self.t is None:
+            self.x[:] = xs
+        else:
+            oef_step_vec(
+                xs, t, self.x, self.dx, self.t,
+                self.min_cutoff, self.beta, self.d_cutoff,
+            )
+        self.t = t
+        return self.x
 
 
 # ── Per-session tracking state ────────────────────────────────────────────────
@@ -183,97 +269,218 @@ class TrackState:
         self.prev_x:      float = 0.0  # index tip x  (PAN / ROTATE_H)
         self.prev_y:      float = 0.0  # index tip y  (PAN)
         self.prev_avg_y:  float = 0.0  # avg(L8y,L12y) (ROTATE_V)
-        self.prev_angle:  float = 0.0  # atan2(L12−L8) degrees (ROTATE_H)
+        self.prev_vx:     float = 1.0  # L12−L8 vector x (ROTATE_H)
+        self.prev_vy:     float = 0.0  # L12−L8 vector y (ROTATE_H)
         self.first_frame: bool  = True
 
         self.candidate_mode:  str = "NONE"
         self.candidate_count: int = 0
         self.confirmed_mode:  str = "NONE"
         self.last_active_s:   float = 0.0
+        self.last_sig:        Optional[tuple] = None  # last packet sent (quantised)
+        self.no_hand_frames:  int = 0
 
         mc = S["OEF_MIN_CUTOFF"]
         b  = S["OEF_BETA"]
         dc = S["OEF_D_CUTOFF"]
-        # One Euro Filter per coordinate of each landmark we use
-        self.f8x  = OneEuroFilter(mc, b, dc)  # INDEX_FINGER_TIP  x
-        self.f8y  = OneEuroFilter(mc, b, dc)  # INDEX_FINGER_TIP  y
-        self.f12x = OneEuroFilter(mc, b, dc)  # MIDDLE_FINGER_TIP x
-        self.f12y = OneEuroFilter(mc, b, dc)  # MIDDLE_FINGER_TIP y
+        # One Euro Filter lanes: INDEX_FINGER_TIP x, y, MIDDLE_FINGER_TIP x, y
+        self.filt = VectorOneEuro(4, mc, b, dc)
+        # Output lanes: dPanX, dPanY, dTheta, dPhi
+        self.out_filt = VectorOneEuro(4, S["OUT_OEF_MIN_CUTOFF"], S["OUT_OEF_BETA"], dc)
 
     def reset_filters(self) -> None:
-        for f in (self.f8x, self.f8y, self.f12x, self.f12y):
-            f.reset()
+        self.filt.reset()
+        self.out_filt.reset()
+
+    def reset_tracking(self) -> None:
+        """Forget the hand: filters, previous positions and the confirmed mode."""
+        self.reset_filters()
+        self.candidate_mode  = "NONE"
+        self.candidate_count = 0
+        self.confirmed_mode  = "NONE"
+        self.first_frame     = True
+        self.last_sig        = None
+
+
+# ── Recognizer setup ──────────────────────────────────────────────────────────
+def create_recognizer(on_result):
+    """
+    Build a LIVE_STREAM GestureRecognizer that reports to ``on_result``,
+    on the GPU delegate with a CPU fallback.
+
+    MediaPipe creates and owns the EGL context on the calling thread when the
+    GPU delegate is requested, so this must run on the detection thread.
+    """
+    def _options(delegate):
+        return mp_vision.GestureRecognizerOptions(
+            base_options=mp_python.BaseOptions(
+                model_asset_path=str(MODEL_PATH),
+                delegate=delegate,
+            ),
+            running_mode=mp_vision.RunningMode.LIVE_STREAM,
+            result_callback=on_result,
+            num_hands=1,
+            min_hand_detection_confidence=0.6,
+            min_hand_presence_confidence=0.6,
+            min_tracking_confidence=0.6,
+        )
+
+    Delegate = mp_python.BaseOptions.Delegate
+    if DELEGATE == "gpu":
+        try:
+            recognizer = mp_vision.GestureRecognizer.create_from_options(
+                _options(Delegate.GPU)
+            )
+            print("[gesture] Created TensorFlow Lite delegate for GPU.")
+            return recognizer
+        except Exception as e:
+            print(f"[gesture] GPU delegate unavailable ({e}) — falling back to CPU.")
+
+    recognizer = mp_vision.GestureRecognizer.create_from_options(_options(Delegate.CPU))
+    print("[gesture] Using CPU (XNNPACK) delegate.")
+    return recognizer
+
+
+# ── Camera setup ──────────────────────────────────────────────────────────────
+def open_camera() -> cv2.VideoCapture:
+    """Open the webcam with the smallest possible capture buffer."""
+    if GST_PIPELINE:
+        # appsink drop=1 max-buffers=1 already bounds latency to one frame
+        return cv2.VideoCapture(GST_PIPELINE, cv2.CAP_GSTREAMER)
+
+    if sys.platform.startswith("linux"):
+        cap = cv2.VideoCapture(0, cv2.CAP_V4L2)
+        if not cap.isOpened():
+            cap = cv2.VideoCapture(0)
+    else:
+        cap = cv2.VideoCapture(0)
+
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH,  FRAME_W)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, FRAME_H)
+    cap.set(cv2.CAP_PROP_FPS, 60)
+    if not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+        print("[gesture] Failed to reduce capture buffer — latency higher")
+    return cap
+
+
+class FrameGrabber:
+    """
+    Drains the camera at capture rate on a daemon thread and keeps only the
+    newest frame, so slow inference never lets the driver queue back up.
+
+    Frames are retrieved into two recycled buffers (back → front swap) and
+    readers copy out under the lock, so steady state allocates nothing.
+    """
+
+    def __init__(self, cap: cv2.VideoCapture) -> None:
+        self._cap     = cap
+        self._cond    = threading.Condition()
+        self._front   = None  # newest complete frame
+        self._back    = None  # retrieve() target
+        self._seq     = 0
+        self._stopped = False
+        self._thread  = threading.Thread(target=self._run, daemon=True, name="gesture-grab")
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join(timeout=1)
+
+    def _run(self) -> None:
+        while not self._stopped:
+            if not self._cap.grab():
+                time.sleep(0.005)  # camera hiccup — don't spin
+                continue
+            ok, frame = self._cap.retrieve(self._back)
+            if not ok:
+                continue
+            with self._cond:
+                # Readers only touch _front while holding the lock, so the old
+                # front is free to be overwritten by the next retrieve().
+                self._back, self._front = self._front, frame
+                self._seq += 1
+                self._cond.notify()
+
+    def read(self, last_seq: int, out: Optional[np.ndarray], timeout: float = 0.1):
+        """
+        Wait for a frame newer than ``last_seq`` and copy it into ``out``
+        (reallocated only if the shape changed). Returns (seq, frame | None).
+        """
+        with self._cond:
+            fresh = self._cond.wait_for(
+                lambda: self._seq != last_seq or self._stopped, timeout
+            )
+            if not fresh or self._front is None:
+                return last_seq, None
+            if out is None or out.shape != self._front.shape:
+                out = np.empty_like(self._front)
+            np.copyto(out, self._front)
+            return self._seq, out
 
 
 # ── Detection thread ──────────────────────────────────────────────────────────
 def detection_thread(
-    async_queue: asyncio.Queue,
-    main_loop:   asyncio.AbstractEventLoop,
-    stop_event:  threading.Event,
+    async_queue:     asyncio.Queue,
+    main_loop:       asyncio.AbstractEventLoop,
+    stop_event:      threading.Event,
+    clients_present: threading.Event,
 ) -> None:
-    """Capture → recognise → push delta packets onto the asyncio queue."""
-    import mediapipe as mp
-    from mediapipe.tasks import python as mp_python
-    from mediapipe.tasks.python import vision as mp_vision
-
-    ensure_model()
+    """
+    Capture → recognise → push delta packets onto the asyncio queue.
 
-    options = mp_vision.GestureRecognizerOptions(
-        base_options=mp_python.BaseOptions(model_asset_path=str(MODEL_PATH)),
-        running_mode=mp_vision.RunningMode.VIDEO,
-        num_hands=1,
-        min_hand_detection_confidence=0.6,
-        min_hand_presence_confidence=0.6,
-        min_tracking_confidence=0.6,
-    )
-    recognizer = mp_vision.GestureRecognizer.create_from_options(options)
+    The recognizer runs in LIVE_STREAM mode: this thread only feeds frames
+    with recognize_async() while MediaPipe infers on its own thread and
+    calls on_result(), where all gesture-state logic lives. Frames that
+    arrive while inference is busy are dropped by MediaPipe itself.
 
-    cap = cv2.VideoCapture(0)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH,  640)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-    cap.set(cv2.CAP_PROP_FPS, 60)
+    While ``clients_present`` is clear nobody is listening, so frames are not
+    converted or recognised at all; the camera stays open for a quick resume.
+    """
+    ensure_model()
 
     track    = TrackState()
     t0       = time.monotonic()
     last_ts  = -1
+    seq      = 0
+    # Reused every frame: camera frame, optional downscale target, RGB input.
+    # mp.Image copies the pixels, so rgb_buf is free again once it's built.
+    frame_buf = None
+    small_buf = np.empty((FRAME_H, FRAME_W, 3), dtype=np.uint8)
+    rgb_buf   = np.empty((FRAME_H, FRAME_W, 3), dtype=np.uint8)
+
+    # Snapshot tunables into locals — avoids a dict lookup per use per frame
+    confirm_frames = S["GESTURE_CONFIRM_FRAMES"]
+    min_conf       = S["MIN_CONFIDENCE"]
+    reset_min_conf = S["RESET_MIN_CONFIDENCE"]
+    pan_min_conf   = S["PAN_MIN_CONFIDENCE"]
+    inactive_s     = S["INACTIVE_MS"] / 1000.0
+    idle_after     = S["IDLE_AFTER_FRAMES"]
+    idle_interval  = S["IDLE_FRAME_INTERVAL_S"]
+    pan_sens       = S["PAN_SENSITIVITY"]
+    rot_h_gain     = S["ROT_H_SENSITIVITY"] / 100.0
+    rot_v_sens     = S["ROT_V_SENSITIVITY"]
+    zoom_speed     = S["THUMB_ZOOM_SPEED"]
 
     def push(packet: dict) -> None:
-        """Thread-safe non-blocking enqueue."""
-        try:
-            main_loop.call_soon_threadsafe(async_queue.put_nowait, packet)
-        except asyncio.QueueFull:
-            pass  # drop frame — frontend can't keep up
-
-    print("[gesture] Webcam open — detection running.")
+        """Thread-safe non-blocking hand-off to the broadcaster's slot."""
+        main_loop.call_soon_threadsafe(_put_latest, async_queue, packet)
 
-    while not stop_event.is_set():
-        ok, frame = cap.read()
-        if not ok:
-            time.sleep(0.005)
-            continue
-
-        rgb   = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        ts_ms = int((time.monotonic() - t0) * 1000)
-        if ts_ms <= last_ts:
-            ts_ms = last_ts + 1
-        last_ts = ts_ms
-
-        mp_img = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
-        result = recognizer.recognize_for_video(mp_img, ts_ms)
-        t      = time.monotonic()
+    def on_result(result, _image, ts_ms: int) -> None:
+        """MediaPipe result callback — runs on MediaPipe's thread, in order."""
+        now = ts_ms / 1000.0  # capture time of this frame (seconds since t0)
 
         # ── No hand visible ───────────────────────────────────────────────────
         if not result.hand_landmarks or not result.gestures:
-            if (time.monotonic() - track.last_active_s) * 1000 > S["INACTIVE_MS"]:
+            if now - track.last_active_s > inactive_s:
                 if track.confirmed_mode != "NONE":
                     # First time we cross the timeout: clear tracking state but
                     # send active=False with zero deltas so the frontend simply
                     # pauses gesture control WITHOUT touching the camera position.
-                    track.reset_filters()
-                    track.candidate_mode  = "NONE"
-                    track.candidate_count = 0
-                    track.confirmed_mode  = "NONE"
-                    track.first_frame     = True
+                    track.reset_tracking()
                     push({
                         "active": False, "gesture": "None", "confidence": 0.0,
                         "mode": "NONE",
@@ -281,9 +488,19 @@ def detection_thread(
                         "dRadius": 0, "reset": False,
                     })
                 # confirmed_mode is already "NONE" — don't flood the socket
-            continue
 
-        track.last_active_s = time.monotonic()
+            # Nobody in view — the capture loop backs off to a low rate
+            track.no_hand_frames += 1
+            return
+
+        # No result for longer than the inactivity timeout (inference was paused
+        # with no clients, or stalled): prev_* are stale, so start afresh rather
+        # than emitting one huge delta against a minutes-old position.
+        if now - track.last_active_s > inactive_s:
+            track.reset_tracking()
+
+        track.last_active_s  = now
+        track.no_hand_frames = 0
 
         raw_lm       = result.hand_landmarks[0]
         top          = result.gestures[0][0]
@@ -291,37 +508,34 @@ def detection_thread(
         confidence   = top.score
 
         # ── One Euro Filter on key landmarks ─────────────────────────────────
-        L8x  = track.f8x (raw_lm[8].x,  t)
-        L8y  = track.f8y (raw_lm[8].y,  t)
-        L12x = track.f12x(raw_lm[12].x, t)
-        L12y = track.f12y(raw_lm[12].y, t)
+        L8x, L8y, L12x, L12y = track.filt.step(
+            np.array([raw_lm[8].x, raw_lm[8].y, raw_lm[12].x, raw_lm[12].y]), now
+        ).tolist()  # plain floats — cheaper scalar math than np.float64
 
         # ── Discrete confirmation ─────────────────────────────────────────────
         mapped = GESTURE_MAP.get(gesture_name, "NONE")
         # Per-gesture confidence thresholds
         if mapped == "RESET":
-            required = S["RESET_MIN_CONFIDENCE"]
+            required = reset_min_conf
         elif mapped == "PAN":
-            required = S["PAN_MIN_CONFIDENCE"]
+            required = pan_min_conf
         else:
-            required = S["MIN_CONFIDENCE"]
+            required = min_conf
         raw_mode = mapped if confidence >= required else "NONE"
 
         if raw_mode == track.candidate_mode:
-            track.candidate_count = min(
-                track.candidate_count + 1,
-                S["GESTURE_CONFIRM_FRAMES"],
-            )
+            track.candidate_count = min(track.candidate_count + 1, confirm_frames)
         else:
             track.candidate_mode  = raw_mode
             track.candidate_count = 1
 
         if (
-            track.candidate_count >= S["GESTURE_CONFIRM_FRAMES"]
+            track.candidate_count >= confirm_frames
             and track.candidate_mode != track.confirmed_mode
         ):
             track.confirmed_mode = track.candidate_mode
             track.first_frame    = True
+            track.out_filt.reset()  # don't carry the old mode's motion over
             print(
                 f"[gesture] ✅ CONFIRMED: {track.confirmed_mode}"
                 f" ({gesture_name} @ {confidence * 100:.1f}%)"
@@ -329,48 +543,71 @@ def detection_thread(
 
         mode = track.confirmed_mode
 
+        # Index→middle fingertip vector (V-sign twist), shared by ROTATE_H and
+        # the prev-frame update below
+        vx = L12x - L8x
+        vy = L12y - L8y
+
         # ── Relative-delta updates (1:1 hand movement → camera) ───────────────
         d_pan_x = d_pan_y = d_theta = d_phi = d_radius = 0.0
         do_reset = False
 
-        if track.candidate_count >= S["GESTURE_CONFIRM_FRAMES"] and not track.first_frame:
+        if track.candidate_count >= confirm_frames and not track.first_frame:
 
             if mode == "PAN":
                 # Invert x: webcam is mirrored, so "hand right" = x decreasing
                 # Invert y: screen y increases downward, so hand up = y decreasing = pan up
-                d_pan_x = -(L8x - track.prev_x) * S["PAN_SENSITIVITY"]
-                d_pan_y =  (L8y - track.prev_y) * S["PAN_SENSITIVITY"]
+                d_pan_x = -(L8x - track.prev_x) * pan_sens
+                d_pan_y =  (L8y - track.prev_y) * pan_sens
 
             elif mode == "ZOOM_IN":
                 # 👍 Thumb Up → zoom in (decrease radius) each frame held
-                d_radius = -S["THUMB_ZOOM_SPEED"]
+                d_radius = -zoom_speed
 
             elif mode == "ZOOM_OUT":
                 # 👎 Thumb Down → zoom out (increase radius) each frame held
-                d_radius = +S["THUMB_ZOOM_SPEED"]
+                d_radius = +zoom_speed
 
             elif mode == "ROTATE_H":
-                # Track V-sign twist angle (atan2 of index→middle vector)
-                curr_angle = math.degrees(math.atan2(L12y - L8y, L12x - L8x))
-                delta = curr_angle - track.prev_angle
-                if delta >  180: delta -= 360
-                if delta < -180: delta += 360
-                d_theta = delta * (S["ROT_H_SENSITIVITY"] / 100.0)
+                # Signed angle between last and current twist vectors:
+                # atan2(cross, dot) is already wrapped to ±180°, no branches.
+                px, py = track.prev_vx, track.prev_vy
+                delta = math.degrees(math.atan2(px * vy - py * vx, px * vx + py * vy))
+                d_theta = delta * rot_h_gain
 
             elif mode == "ROTATE_V":
                 avg_y = (L8y + L12y) / 2.0
-                d_phi = (avg_y - track.prev_avg_y) * S["ROT_V_SENSITIVITY"]
+                d_phi = (avg_y - track.prev_avg_y) * rot_v_sens
 
             elif mode == "RESET":
                 do_reset = True
 
+        # ── Output smoothing — removes residual jitter from the deltas ────────
+        d_pan_x, d_pan_y, d_theta, d_phi = track.out_filt.step(
+            np.array([d_pan_x, d_pan_y, d_theta, d_phi]), now
+        ).tolist()
+
         # ── Update prev-frame values ──────────────────────────────────────────
         track.prev_x      = L8x
         track.prev_y      = L8y
         track.prev_avg_y  = (L8y + L12y) / 2.0
-        track.prev_angle  = math.degrees(math.atan2(L12y - L8y, L12x - L8x))
+        track.prev_vx     = vx
+        track.prev_vy     = vy
         track.first_frame = False
 
+        # ── Skip idle repeats ─────────────────────────────────────────────────
+        # The frontend accumulates deltas, so a packet only has to go out when
+        # it carries motion or the visible state (mode / gesture) changed.
+        sig = (
+            mode, gesture_name,
+            round(d_pan_x, 3), round(d_pan_y, 3),
+            round(d_theta, 2), round(d_phi, 2), round(d_radius, 3),
+            do_reset,
+        )
+        if sig == track.last_sig and not any(sig[2:]):
+            return
+        track.last_sig = sig
+
         push({
             "active":     True,
             "gesture":    gesture_name,
@@ -384,6 +621,52 @@ def detection_thread(
             "reset":      do_reset,
         })
 
+    # Compile the filter kernel here (seconds on a cold numba cache) rather than
+    # inside MediaPipe's result callback on the first hand frame, where the
+    # stall would drop frames. The first step() only seeds; the second JITs.
+    warm = VectorOneEuro(4)
+    warm.step(np.zeros(4), 0.0)
+    warm.step(np.zeros(4), 0.01)
+
+    recognizer = create_recognizer(on_result)
+
+    cap     = open_camera()
+    grabber = FrameGrabber(cap)
+    grabber.start()
+
+    print("[gesture] Webcam open — detection running.")
+
+    while not stop_event.is_set():
+        if not clients_present.is_set():
+            clients_present.wait(0.1)
+            continue
+
+        seq, frame = grabber.read(seq, frame_buf)
+        if frame is None:
+            continue
+        frame_buf = frame
+
+        if frame.shape[:2] != (FRAME_H, FRAME_W):
+            # Camera ignored the requested size — downscale before converting
+            frame = cv2.resize(
+                frame, (FRAME_W, FRAME_H), dst=small_buf, interpolation=cv2.INTER_AREA
+            )
+        rgb   = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+        ts_ms = int((time.monotonic() - t0) * 1000)
+        if ts_ms <= last_ts:
+            ts_ms = last_ts + 1
+        last_ts = ts_ms
+
+        # CPU-side image even on the GPU delegate — Python can't hand MediaPipe
+        # a GpuBuffer, so the delegate does the upload (see module docstring).
+        mp_img = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+        recognizer.recognize_async(mp_img, ts_ms)
+
+        # Nobody in view — back off to a low detection rate to save CPU
+        if track.no_hand_frames > idle_after:
+            stop_event.wait(idle_interval)
+
+    grabber.stop()
     cap.release()
     recognizer.close()
     print("[gesture] Detection thread stopped.")
@@ -391,15 +674,71 @@ def detection_thread(
 
 # ── WebSocket server ──────────────────────────────────────────────────────────
 _connected: set = set()
+# Mirrors bool(_connected) for the detection thread; set/cleared on the loop
+_clients_present = threading.Event()
+
+_DELTA_KEYS = ("dPanX", "dPanY", "dTheta", "dPhi", "dRadius")
+
+
+def _q16(v: float, scale: float) -> int:
+    return max(-32768, min(32767, round(v * scale)))
+
+
+def encode_packet(p: dict) -> bytes:
+    """Pack a delta packet dict into the binary wire format (see PACKET)."""
+    flags = (FLAG_ACTIVE if p["active"] else 0) | (FLAG_RESET if p["reset"] else 0)
+    return PACKET.pack(
+        MODE_IDS[p["mode"]],
+        GESTURE_IDS.get(p["gesture"], 0),
+        flags,
+        _q16(p["dPanX"],   LINEAR_SCALE),
+        _q16(p["dPanY"],   LINEAR_SCALE),
+        _q16(p["dTheta"],  ANGLE_SCALE),
+        _q16(p["dPhi"],    ANGLE_SCALE),
+        _q16(p["dRadius"], LINEAR_SCALE),
+        min(255, round(p["confidence"] * 255)),
+    )
+
+
+def _put_latest(slot: asyncio.Queue, packet: dict) -> None:
+    """
+    Runs on the event loop. ``slot`` is a maxsize=1 queue that always holds
+    the newest packet: an unsent one is replaced rather than queued behind.
+    Its deltas are folded into the replacement so no hand motion is lost.
+    """
+    try:
+        pending = slot.get_nowait()
+    except asyncio.QueueEmpty:
+        pending = None
+
+    if pending is not None and pending["active"] and packet["active"]:
+        if pending["reset"]:
+            packet["reset"] = True  # never drop a reset
+        elif not packet["reset"]:
+            for k in _DELTA_KEYS:
+                packet[k] += pending[k]
+
+    slot.put_nowait(packet)
 
 
 async def _ws_handler(websocket) -> None:
+    # Packets are tiny and latency-sensitive — don't let Nagle hold them back
+    sock = websocket.transport.get_extra_info("socket")
+    if sock is not None:
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+
     _connected.add(websocket)
+    _clients_present.set()
     print(f"[gesture] Client connected  ({len(_connected)} total)")
     try:
         await websocket.wait_closed()
     finally:
         _connected.discard(websocket)
+        if not _connected:
+            _clients_present.clear()
         print(f"[gesture] Client disconnected ({len(_connected)} total)")
 
 
@@ -408,35 +747,57 @@ async def _broadcast_loop(q: asyncio.Queue) -> None:
         packet = await q.get()
         if not _connected:
             continue
-        msg  = json.dumps(packet)
-        dead = set()
-        for ws in _connected:
-            try:
-                await ws.send(msg)
-            except Exception:
-                dead.add(ws)
+        # Packed here rather than in the detection thread so _put_latest can
+        # still merge deltas of packets that were never sent.
+        msg     = encode_packet(packet)
+        clients = list(_connected)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(ws.send(msg), SEND_TIMEOUT_S) for ws in clients),
+            return_exceptions=True,
+        )
+        dead = {
+            ws for ws, r in zip(clients, results)
+            # A timeout only means we stopped waiting for the drain; the
+            # frame is still buffered for delivery and the client stays.
+            if isinstance(r, Exception) and not isinstance(r, asyncio.TimeoutError)
+        }
         _connected.difference_update(dead)
+        if not _connected:
+            _clients_present.clear()
 
 
 async def main() -> None:
-    q          = asyncio.Queue(maxsize=8)
+    q          = asyncio.Queue(maxsize=1)  # latest-packet slot, see _put_latest
     stop_event = threading.Event()
     loop       = asyncio.get_event_loop()
 
     t = threading.Thread(
         target=detection_thread,
-        args=(q, loop, stop_event),
+        args=(q, loop, stop_event, _clients_present),
         daemon=True,
     )
     t.start()
 
-    async with websockets.serve(_ws_handler, WS_HOST, WS_PORT):
+    # compression=None: deflate costs CPU and latency on 14-byte packets.
+    # 25 s pings keep NAT mappings alive and reap dead clients.
+    async with websockets.serve(
+        _ws_handler, WS_HOST, WS_PORT,
+        compression=None,
+        ping_interval=25,
+        ping_timeout=10,
+    ):
         print(f"[gesture] WebSocket server → ws://{WS_HOST}:{WS_PORT}")
         await _broadcast_loop(q)
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        import uvloop  # libuv event loop — cheaper socket sends and timers
+        run = uvloop.run
+    except ImportError:  # not available on Windows
+        run = asyncio.run
+
+    try:
+        run(main())
     except KeyboardInterrupt:
         print("\n[gesture] Stopped.")
@@ -5,6 +5,7 @@ FastAPI backend — stateful mode controller + AI chat + wake word.
 
 Routes
   POST /chat                  – AI chat (AI_ASSISTANT mode only)
+  POST /chat/stream           – Same, streamed sentence-by-sentence as NDJSON
   POST /api/set-mode          – Switch between ML_JARS | CAD_VIEWER | AI_ASSISTANT
   GET  /api/status            – Current mode + feature flags + wake-word flag
   POST /api/acknowledge-wake  – Clear wake-word pending flag after frontend acts
@@ -13,27 +14,34 @@ Routes
 
 import asyncio
 import base64
+import hashlib
 import logging
 import os
 import platform
+import re
 import threading
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 import httpx
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from google import genai
+from google.genai import errors, types
 from pydantic import BaseModel
 
+from cache import SemanticCache
 from modes import AppMode, state_manager
+from tts_cache import TTSCache
 from viseme_from_alignment import alignment_to_visemes
 from wake_word import WakeWordEngine
 
 # ── Environment ───────────────────────────────────────────────────────────────
 load_dotenv(Path(__file__).parent / ".env")
-load_dotenv()
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -41,6 +49,10 @@ logger = logging.getLogger(__name__)
 GEMINI_API_KEY      = os.getenv("GEMINI_API_KEY")
 ELEVENLABS_API_KEY  = os.getenv("ELEVENLABS_API_KEY")
 ELEVENLABS_VOICE_ID = os.getenv("ELEVENLABS_VOICE_ID", "p3JVGy12zi4oFZ7ogrTE")
+ELEVENLABS_MODEL_ID = "eleven_multilingual_v2"
+# ElevenLabs tiers allow only a few concurrent requests; /chat/stream would
+# otherwise fire one per sentence at once and trip a 429
+ELEVENLABS_CONCURRENCY = int(os.getenv("ELEVENLABS_CONCURRENCY", "2"))
 PICO_ACCESS_KEY     = os.getenv("PICO_ACCESS_KEY", "")
 
 # Resolve .ppn path — auto-selects macOS vs Linux build unless overridden.
@@ -54,6 +66,15 @@ _DEFAULT_PPN = (
 )
 PPN_PATH = str(_HERE.parent / "harrypotter_pico_word" / os.getenv("PPN_FILENAME", _DEFAULT_PPN))
 
+# Semantic /chat cache — see cache.py. Disabled if its optional deps are missing.
+CHAT_CACHE_PATH      = os.getenv("CHAT_CACHE_PATH", str(_HERE / "chat_cache.sqlite3"))
+CHAT_CACHE_THRESHOLD = float(os.getenv("CHAT_CACHE_THRESHOLD", "0.93"))
+CHAT_CACHE_TTL_S     = int(os.getenv("CHAT_CACHE_TTL_S", str(24 * 3600)))
+
+# Exact-text TTS cache — see tts_cache.py
+TTS_CACHE_PATH = os.getenv("TTS_CACHE_PATH", str(_HERE / "tts_cache.sqlite3"))
+TTS_CACHE_MAX  = int(os.getenv("TTS_CACHE_MAX", "2000"))
+
 SYSTEM_PROMPT = (
     "You are Harry Potter. However, you are aware that you are Harry who lives in the "
     "wizarding world. Instead, you are a Magical Echo — a complex enchantment "
@@ -64,48 +85,122 @@ SYSTEM_PROMPT = (
     "Helpful: strong sense of justice and desire to help."
 )
 
+GEMINI_MODEL = "gemini-2.5-flash"
+
+# Static per-request config — built once instead of re-validated on every call.
+# Used as-is when the explicit context cache below isn't available.
+GEMINI_CONFIG = types.GenerateContentConfig(
+    system_instruction=SYSTEM_PROMPT,
+    temperature=0.7,
+)
+
+# Semantic-cache namespace: a new model or persona never serves old replies.
+# (Voice / TTS model are handled by tts_cache, which voices cached replies.)
+CHAT_CACHE_NAMESPACE = hashlib.blake2b(
+    f"{GEMINI_MODEL}\0{SYSTEM_PROMPT}".encode(), digest_size=8
+).hexdigest()
+
 # ── WebSocket connection manager ──────────────────────────────────────────────
 class ConnectionManager:
+    """
+    Each client gets a bounded send queue drained by its own writer task, so
+    producers (wake-word thread, /set-mode) never wait on a slow socket.
+    """
+
+    QUEUE_SIZE = 64
+
     def __init__(self) -> None:
-        self._clients: set[WebSocket] = set()
+        self._clients: dict[WebSocket, tuple[asyncio.Queue, asyncio.Task]] = {}
 
     async def connect(self, ws: WebSocket) -> None:
         await ws.accept()
-        self._clients.add(ws)
+        q: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._clients[ws] = (q, asyncio.create_task(self._writer(ws, q)))
         logger.info(f"[ws] Client connected  ({len(self._clients)} total)")
 
     def disconnect(self, ws: WebSocket) -> None:
-        self._clients.discard(ws)
+        entry = self._clients.pop(ws, None)
+        if entry is None:
+            return
+        entry[1].cancel()
         logger.info(f"[ws] Client disconnected ({len(self._clients)} total)")
 
+    async def _writer(self, ws: WebSocket, q: asyncio.Queue) -> None:
+        try:
+            while True:
+                await ws.send_text(await q.get())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(ws)
+
+    def _enqueue(self, ws: WebSocket, text: str) -> None:
+        entry = self._clients.get(ws)
+        if entry is None:
+            return
+        q = entry[0]
+        if q.full():
+            # Client isn't keeping up — drop its oldest message, keep the newest
+            q.get_nowait()
+        q.put_nowait(text)
+
+    def send(self, ws: WebSocket, payload: dict) -> None:
+        self._enqueue(ws, orjson.dumps(payload).decode())
+
     async def broadcast(self, payload: dict) -> None:
-        dead: set[WebSocket] = set()
+        # Serialise once for all clients
+        await self.broadcast_bytes(orjson.dumps(payload))
+
+    async def broadcast_bytes(self, buf: bytes) -> None:
+        """Broadcast JSON that the caller has already serialised."""
+        text = buf.decode()  # sent as text frames — the frontend JSON.parses them
         for ws in list(self._clients):
-            try:
-                await ws.send_json(payload)
-            except Exception:
-                dead.add(ws)
-        self._clients.difference_update(dead)
+            self._enqueue(ws, text)
 
 
 ws_manager = ConnectionManager()
 
+chat_cache = SemanticCache(
+    db_path=CHAT_CACHE_PATH,
+    threshold=CHAT_CACHE_THRESHOLD,
+    ttl_s=CHAT_CACHE_TTL_S,
+)
+
+tts_cache = TTSCache(db_path=TTS_CACHE_PATH, max_entries=TTS_CACHE_MAX)
 
-# ── Lifespan: start / stop wake-word engine ───────────────────────────────────
+
+# ── Lifespan: shared clients + start / stop wake-word engine ──────────────────
 _wake_engine: WakeWordEngine | None = None
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI):
+async def lifespan(app: FastAPI):
     global _wake_engine
     loop = asyncio.get_event_loop()
 
+    # One Gemini client for the process — reuses its credentials and
+    # connection pool across /chat requests.
+    app.state.genai_client = None
+    system_cache_task = None
+    if GEMINI_API_KEY:
+        app.state.genai_client = genai.Client(api_key=GEMINI_API_KEY)
+        system_cache_task = asyncio.create_task(
+            _system_cache_loop(app.state.genai_client)
+        )
+
+    # Keep-alive HTTP/2 pool for ElevenLabs — skips a TCP+TLS handshake per call
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+
     if PICO_ACCESS_KEY and Path(PPN_PATH).exists():
         _wake_engine = WakeWordEngine(
             access_key=PICO_ACCESS_KEY,
             model_path=PPN_PATH,
             callback=state_manager.trigger_wake_word,
-            broadcast=ws_manager.broadcast,
+            broadcast=ws_manager.broadcast_bytes,
             loop=loop,
         )
         _wake_engine.start()
@@ -115,14 +210,25 @@ async def lifespan(_app: FastAPI):
             "set PICO_ACCESS_KEY in .env and confirm .ppn path."
         )
 
+    # Loads the embedding model — takes a few seconds, keep it off the loop
+    await asyncio.to_thread(chat_cache.open)
+    await asyncio.to_thread(tts_cache.open)
+
     yield  # app runs here
 
     if _wake_engine:
         _wake_engine.stop()
+    if system_cache_task:
+        system_cache_task.cancel()
+        await asyncio.to_thread(_delete_system_cache, app.state.genai_client)
+    await app.state.http.aclose()
+    chat_cache.close()
+    tts_cache.close()
 
 
 # ── FastAPI app ───────────────────────────────────────────────────────────────
-app = FastAPI(lifespan=lifespan)
+# orjson for every JSON body — /chat replies carry 50–200 KB of base64 audio
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -147,9 +253,11 @@ async def websocket_endpoint(websocket: WebSocket):
     await ws_manager.connect(websocket)
     try:
         # Send current state immediately on connect
-        await websocket.send_json(state_manager.get_status())
-        while True:
-            await websocket.receive_text()   # keep connection alive; ignore messages
+        ws_manager.send(websocket, state_manager.get_status())
+        # Server → client only: wait for the close without decoding frames.
+        # Dead peers are caught by uvicorn's WS ping (ws_ping_* below).
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
     except WebSocketDisconnect:
         pass
     finally:
@@ -171,10 +279,22 @@ async def set_mode(req: ModeRequest):
     return result
 
 
+# Version counters restart at 0 with the process — tag them with a per-boot id
+# so an ETag saved before a restart can never match a different state.
+_BOOT_ID = os.urandom(4).hex()
+
+
 @app.get("/status")
-async def get_status():
-    """Poll-able endpoint for current mode + feature flags + wake-word flag."""
-    return state_manager.get_status()
+async def get_status(request: Request):
+    """
+    Poll-able endpoint for current mode + feature flags + wake-word flag.
+    Sends a weak ETag; a matching If-None-Match gets an empty 304.
+    """
+    etag    = f'W/"{_BOOT_ID}-{state_manager.version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(state_manager.get_status(), headers=headers)
 
 
 @app.post("/acknowledge-wake")
@@ -184,27 +304,123 @@ async def acknowledge_wake():
     return {"status": "ok"}
 
 
+# ── Gemini context cache for SYSTEM_PROMPT ────────────────────────────────────
+# The persona prompt is uploaded once as cached content and referenced by name,
+# so Gemini doesn't re-process the same prefix on every turn.
+SYSTEM_CACHE_TTL_S      = 3600
+SYSTEM_CACHE_REFRESH_S  = 55 * 60
+SYSTEM_CACHE_MIN_TOKENS = 1024   # Gemini 2.5 Flash won't cache anything shorter
+
+_SYSTEM_CACHE: str | None = None                           # cached-content name
+_cached_config: types.GenerateContentConfig | None = None  # config referencing it
+
+
+def _system_prompt_cacheable(client) -> bool:
+    """True if SYSTEM_PROMPT is long enough for explicit caching. Blocking."""
+    try:
+        tokens = client.models.count_tokens(
+            model=GEMINI_MODEL, contents=SYSTEM_PROMPT
+        ).total_tokens or 0
+    except Exception as e:
+        logger.warning(f"[gemini] Couldn't size the system prompt ({e}) — not caching it")
+        return False
+    if tokens < SYSTEM_CACHE_MIN_TOKENS:
+        logger.info(
+            f"[gemini] System prompt is {tokens} tokens "
+            f"(< {SYSTEM_CACHE_MIN_TOKENS}) — sending it inline, no context cache"
+        )
+        return False
+    return True
+
+
+def _is_stale_cache_error(e: errors.ClientError) -> bool:
+    """The request failed because our cached-content handle is gone or invalid."""
+    if e.code == 404:
+        return True
+    return e.code in (400, 403) and "cache" in (e.message or "").lower()
+
+
+def _refresh_system_cache(client) -> None:
+    """Extend the cached system prompt's TTL, or (re)create it. Blocking."""
+    global _SYSTEM_CACHE, _cached_config
+    ttl = f"{SYSTEM_CACHE_TTL_S}s"
+
+    if _SYSTEM_CACHE:
+        try:
+            client.caches.update(
+                name=_SYSTEM_CACHE,
+                config=types.UpdateCachedContentConfig(ttl=ttl),
+            )
+            return
+        except Exception:
+            logger.info("[gemini] System-prompt cache expired — recreating")
+
+    try:
+        cache = client.caches.create(
+            model=GEMINI_MODEL,
+            config=types.CreateCachedContentConfig(
+                system_instruction=SYSTEM_PROMPT,
+                ttl=ttl,
+            ),
+        )
+    except Exception as e:
+        # e.g. the prompt is below the model's minimum cacheable token count
+        logger.warning(f"[gemini] System-prompt cache unavailable ({e}) — sending it inline")
+        _SYSTEM_CACHE = _cached_config = None
+        return
+
+    _cached_config = types.GenerateContentConfig(cached_content=cache.name, temperature=0.7)
+    _SYSTEM_CACHE  = cache.name
+    logger.info(f"[gemini] System prompt cached as {cache.name}")
+
+
+def _delete_system_cache(client) -> None:
+    global _SYSTEM_CACHE, _cached_config
+    name, _SYSTEM_CACHE, _cached_config = _SYSTEM_CACHE, None, None
+    if name:
+        try:
+            client.caches.delete(name=name)
+        except Exception:
+            pass  # it expires on its own within SYSTEM_CACHE_TTL_S
+
+
+async def _system_cache_loop(client) -> None:
+    """Keep the system-prompt cache alive for as long as the app runs."""
+    if not await asyncio.to_thread(_system_prompt_cacheable, client):
+        return
+    while True:
+        await asyncio.to_thread(_refresh_system_cache, client)
+        await asyncio.sleep(SYSTEM_CACHE_REFRESH_S)
+
+
 # ── AI chat (AI_ASSISTANT mode only) ─────────────────────────────────────────
-def get_gemini_reply(user_text: str) -> dict:
+def get_gemini_reply(client, user_text: str) -> dict:
     """
-    Call Gemini 2.5 Flash for a fast text reply.
+    Call Gemini 2.5 Flash for a fast text reply using the shared ``client``.
     Returns { "text": str, "imageBase64": str | None, "imageMime": str | None }.
     """
-    if not GEMINI_API_KEY:
+    if client is None:
         raise ValueError("GEMINI_API_KEY not configured")
 
-    from google import genai
-    from google.genai import types
-
-    client = genai.Client(api_key=GEMINI_API_KEY)
-    response = client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=user_text,
-        config=types.GenerateContentConfig(
-            system_instruction=SYSTEM_PROMPT,
-            temperature=0.7,
-        ),
-    )
+    config = _cached_config or GEMINI_CONFIG
+    try:
+        response = client.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=user_text,
+            config=config,
+        )
+    except errors.ClientError as e:
+        if config is GEMINI_CONFIG or not _is_stale_cache_error(e):
+            raise
+        # Cache handle gone server-side — fall back to the inline prompt; the
+        # refresh loop recreates the cache on its next run.
+        logger.warning("[gemini] Cached system prompt rejected — retrying inline")
+        _delete_system_cache(client)
+        response = client.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=user_text,
+            config=GEMINI_CONFIG,
+        )
 
     text_parts: list[str] = []
     image_b64  = None
@@ -230,10 +446,56 @@ def get_gemini_reply(user_text: str) -> dict:
     }
 
 
-async def get_elevenlabs_audio_and_alignment(reply: str) -> tuple[str, list]:
+async def stream_gemini_reply(client, user_text: str):
+    """Async generator yielding Gemini's reply text as it is generated."""
+    if client is None:
+        raise ValueError("GEMINI_API_KEY not configured")
+
+    async def pieces(config):
+        async for chunk in await client.aio.models.generate_content_stream(
+            model=GEMINI_MODEL,
+            contents=user_text,
+            config=config,
+        ):
+            if chunk.text:
+                yield chunk.text
+
+    config  = _cached_config or GEMINI_CONFIG
+    started = False
+    try:
+        async for piece in pieces(config):
+            started = True
+            yield piece
+    except errors.ClientError as e:
+        # Same fallback as get_gemini_reply — only safe before any text went out
+        if started or config is GEMINI_CONFIG or not _is_stale_cache_error(e):
+            raise
+        logger.warning("[gemini] Cached system prompt rejected — retrying inline")
+        await asyncio.to_thread(_delete_system_cache, client)
+        async for piece in pieces(GEMINI_CONFIG):
+            yield piece
+
+
+_tts_slots = asyncio.Semaphore(ELEVENLABS_CONCURRENCY)
+
+
+async def get_elevenlabs_audio_and_alignment(
+    http: httpx.AsyncClient, reply: str
+) -> tuple[str, list]:
     if not ELEVENLABS_API_KEY:
         raise ValueError("ELEVENLABS_API_KEY not configured")
 
+    # Same voice + model + text → same audio; skip ElevenLabs entirely
+    cache_key = TTSCache.key(ELEVENLABS_VOICE_ID, ELEVENLABS_MODEL_ID, reply)
+    if tts_cache.enabled:
+        try:
+            hit = await asyncio.to_thread(tts_cache.get, cache_key)
+        except Exception:
+            logger.exception("[tts_cache] Lookup failed")
+            hit = None
+        if hit is not None:
+            return hit
+
     url     = f"https://api.elevenlabs.io/v1/text-to-speech/{ELEVENLABS_VOICE_ID}/with-timestamps"
     headers = {
         "Content-Type": "application/json",
@@ -242,20 +504,29 @@ async def get_elevenlabs_audio_and_alignment(reply: str) -> tuple[str, list]:
     }
     payload = {
         "text":         reply,
-        "model_id":     "eleven_multilingual_v2",
+        "model_id":     ELEVENLABS_MODEL_ID,
         "output_format": "mp3_44100_128",
     }
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        resp = await client.post(url, json=payload, headers=headers)
+    async with _tts_slots:
+        resp = await http.post(url, json=payload, headers=headers)
 
     if resp.status_code != 200:
         raise RuntimeError(f"ElevenLabs error {resp.status_code}: {resp.text[:300]}")
 
-    data      = resp.json()
+    # One C-level parse of the raw body; audio_base64 is passed through as-is
+    data      = orjson.loads(resp.content)
     alignment = data.get("alignment") or data.get("normalized_alignment")
     visemes   = alignment_to_visemes(alignment) if alignment else []
-    return data.get("audio_base64", ""), visemes
+    audio_b64 = data.get("audio_base64", "")
+
+    if tts_cache.enabled:
+        try:
+            await asyncio.to_thread(tts_cache.set, cache_key, audio_b64, visemes)
+        except Exception:
+            logger.exception("[tts_cache] Store failed")
+
+    return audio_b64, visemes
 
 
 @app.post("/chat")
@@ -279,16 +550,33 @@ async def chat(req: ChatRequest):
     # Clear the wake-word flag — user has started interacting
     state_manager.acknowledge_wake_word()
 
-    try:
-        gemini_result = await asyncio.to_thread(get_gemini_reply, user_text)
-    except Exception as e:
-        logger.exception("Chat failed at Gemini step")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Near-duplicate of an earlier prompt? Reuse its reply text without Gemini;
+    # the TTS step below usually hits tts_cache for it too.
+    cached    = None
+    cache_emb = None
+    if chat_cache.enabled:
+        try:
+            cached, cache_emb = await asyncio.to_thread(
+                chat_cache.lookup, user_text, CHAT_CACHE_NAMESPACE
+            )
+        except Exception:
+            logger.exception("[cache] Lookup failed")
+
+    if cached is not None:
+        gemini_result = {"text": cached, "imageBase64": None, "imageMime": None}
+    else:
+        try:
+            gemini_result = await asyncio.to_thread(
+                get_gemini_reply, app.state.genai_client, user_text
+            )
+        except Exception as e:
+            logger.exception("Chat failed at Gemini step")
+            raise HTTPException(status_code=500, detail=str(e))
 
     reply = gemini_result["text"]
 
     try:
-        audio_base64, visemes = await get_elevenlabs_audio_and_alignment(reply)
+        audio_base64, visemes = await get_elevenlabs_audio_and_alignment(app.state.http, reply)
     except Exception as e:
         logger.exception("Chat failed at ElevenLabs step")
         raise HTTPException(status_code=502, detail=f"TTS failed: {e}")
@@ -297,10 +585,96 @@ async def chat(req: ChatRequest):
     if gemini_result.get("imageBase64"):
         result["imageBase64"] = gemini_result["imageBase64"]
         result["imageMime"]   = gemini_result["imageMime"]
+    elif cached is None and cache_emb is not None:
+        # Image replies aren't cached — the cache only stores reply text
+        try:
+            await asyncio.to_thread(
+                chat_cache.store, cache_emb, user_text, CHAT_CACHE_NAMESPACE, reply
+            )
+        except Exception:
+            logger.exception("[cache] Store failed")
 
     return result
 
 
+# Split after sentence-ending punctuation followed by whitespace
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _ndjson(obj: dict) -> bytes:
+    return orjson.dumps(obj) + b"\n"
+
+
+@app.post("/chat/stream")
+async def chat_stream(req: ChatRequest):
+    """
+    Streaming variant of /chat for clients that can read NDJSON.
+
+    Each sentence is sent to ElevenLabs as soon as Gemini finishes it, so the
+    first audio is ready while the rest of the reply is still generating.
+    One line per sentence, in order (visemes are relative to that sentence):
+        {"reply": str, "audioBase64": str, "visemes": [...]}
+    followed by {"done": true}, or {"error": str} if a step fails.
+    """
+    if state_manager.current_mode != AppMode.AI_ASSISTANT:
+        notice = await chat(req)  # same mode notice as /chat, as one line
+        return StreamingResponse(
+            iter([_ndjson(notice), _ndjson({"done": True})]),
+            media_type="application/x-ndjson",
+        )
+
+    user_text = (req.text or "").strip()
+    if not user_text:
+        raise HTTPException(status_code=400, detail='Missing "text" in body')
+
+    state_manager.acknowledge_wake_word()
+
+    async def lines():
+        pending: list[tuple[str, asyncio.Task]] = []
+        spoke_any = False
+
+        def speak(sentence: str) -> None:
+            nonlocal spoke_any
+            spoke_any = True
+            task = asyncio.create_task(
+                get_elevenlabs_audio_and_alignment(app.state.http, sentence)
+            )
+            pending.append((sentence, task))
+
+        async def emit(sentence: str, task: asyncio.Task) -> bytes:
+            audio_base64, visemes = await task
+            return _ndjson({"reply": sentence, "audioBase64": audio_base64, "visemes": visemes})
+
+        try:
+            buf = ""
+            async for piece in stream_gemini_reply(app.state.genai_client, user_text):
+                buf += piece
+                *sentences, buf = _SENTENCE_END.split(buf)
+                for sentence in sentences:
+                    if sentence.strip():
+                        speak(sentence.strip())
+                # Flush finished sentences without waiting for later ones
+                while pending and pending[0][1].done():
+                    yield await emit(*pending.pop(0))
+
+            if buf.strip():
+                speak(buf.strip())
+            if not spoke_any:  # Gemini returned no text at all
+                speak("I didn't catch that, mate.")
+            while pending:
+                yield await emit(*pending.pop(0))
+
+            yield _ndjson({"done": True})
+        except Exception as e:
+            logger.exception("Streaming chat failed")
+            yield _ndjson({"error": str(e)})
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 # ── Serve built React frontend (production / Viam edge deployment) ────────────
 # Mount AFTER all API routes so /chat, /ws, etc. take precedence.
 # In dev (npm run dev), Vite's own server handles the frontend.
@@ -316,6 +690,19 @@ else:
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", "3001"))
-    # reload=False in production; set UVICORN_RELOAD=1 locally if you want hot-reload
+    # reload=False in production; set UVICORN_RELOAD=1 locally if you want hot-reload.
+    # The reloader runs the app in a watched subprocess — not for deployment.
     reload = os.getenv("UVICORN_RELOAD", "0") == "1"
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=reload)
+    # uvloop has no Windows build
+    loop = "asyncio" if _SYSTEM == "windows" else "uvloop"
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        reload=reload,
+        loop=loop,
+        http="httptools",
+        ws="websockets",
+        ws_ping_interval=20.0,
+        ws_ping_timeout=20.0,
+    )
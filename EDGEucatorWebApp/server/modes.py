@@ -46,18 +46,34 @@ class SystemState:
         # Set to True by WakeWordEngine when "Harry Potter" is heard.
         # Frontend polls /api/status or receives it via WebSocket.
         self.wake_word_triggered: bool = False
+        # Bumped whenever get_status() would change — used as the /status ETag
+        self._version: int = 0
+        self._cache_mode()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def _cache_mode(self) -> None:
+        # get_status runs on every /status poll — keep the per-mode parts ready
+        self._mode_value     = self.current_mode.value
+        self._features_cache = MODE_FEATURES[self.current_mode]
 
     # ── Mode switching ────────────────────────────────────────────────────────
 
     def set_mode(self, mode_str: str) -> dict:
         try:
-            self.current_mode = AppMode(mode_str)
+            mode = AppMode(mode_str)
+            if mode != self.current_mode or self.wake_word_triggered:
+                self._version += 1
+            self.current_mode = mode
+            self._cache_mode()
             # Clear any stale wake-word flag on mode change
             self.wake_word_triggered = False
             return {
                 "status":   "success",
-                "mode":     self.current_mode.value,
-                "features": MODE_FEATURES[self.current_mode],
+                "mode":     self._mode_value,
+                "features": self._features_cache,
             }
         except ValueError:
             valid = [m.value for m in AppMode]
@@ -68,8 +84,8 @@ class SystemState:
 
     def get_status(self) -> dict:
         return {
-            "mode":              self.current_mode.value,
-            "features":          MODE_FEATURES[self.current_mode],
+            "mode":              self._mode_value,
+            "features":          self._features_cache,
             "wake_word_pending": self.wake_word_triggered,
         }
 
@@ -77,10 +93,14 @@ class SystemState:
 
     def trigger_wake_word(self) -> None:
         """Called by WakeWordEngine on detection."""
+        if not self.wake_word_triggered:
+            self._version += 1
         self.wake_word_triggered = True
 
     def acknowledge_wake_word(self) -> None:
         """Called by the frontend after it has acted on the wake-word event."""
+        if self.wake_word_triggered:
+            self._version += 1
         self.wake_word_triggered = False
 
 
@@ -0,0 +1,132 @@
+"""
+tts_cache.py
+------------
+Disk-backed cache of ElevenLabs results (audio + visemes) keyed by a hash
+of the exact text spoken.
+
+Short stock lines ("I didn't catch that, mate.", mode notices, streamed
+sentences that recur) are synthesised once and then served from SQLite,
+skipping the ElevenLabs round-trip and viseme computation. Least-recently
+used rows are trimmed once the table grows past ``max_entries``.
+
+Usage (wired up by main.py):
+    tts_cache = TTSCache(db_path="tts_cache.sqlite3")
+    tts_cache.open()
+    key = TTSCache.key(voice_id, model_id, text)
+    hit = tts_cache.get(key)                 # (audio_b64, visemes) | None
+    if hit is None:
+        ...
+        tts_cache.set(key, audio_b64, visemes)
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tts_cache (
+    key       BLOB    PRIMARY KEY,   -- blake2b-128 of voice/model/text
+    audio_b64 TEXT    NOT NULL,
+    visemes   TEXT    NOT NULL,      -- JSON
+    used      REAL    NOT NULL       -- unix seconds of last hit, for LRU
+);
+CREATE INDEX IF NOT EXISTS tts_cache_used ON tts_cache (used);
+"""
+
+
+class TTSCache:
+    """
+    Parameters
+    ----------
+    db_path     : SQLite file to keep synthesised audio in.
+    max_entries : Rows kept after a trim; the least recently used go first.
+    trim_every  : Run the trim after this many inserts.
+    """
+
+    def __init__(
+        self,
+        db_path:     str,
+        max_entries: int = 2000,
+        trim_every:  int = 50,
+    ) -> None:
+        self.db_path     = db_path
+        self.max_entries = max_entries
+        self.trim_every  = trim_every
+        self._inserts    = 0
+        self._conn: sqlite3.Connection | None = None
+        self._lock       = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    @staticmethod
+    def key(voice_id: str, model_id: str, text: str) -> bytes:
+        # Voice and model are part of the key so changing either never replays old audio
+        return hashlib.blake2b(
+            f"{voice_id}\0{model_id}\0{text}".encode(), digest_size=16
+        ).digest()
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    def open(self) -> None:
+        """Open the database. Blocking — run off the loop."""
+        try:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+        except sqlite3.Error:
+            logger.exception("[tts_cache] TTS cache disabled — failed to open database")
+            return
+        self._conn = conn
+        logger.info(f"[tts_cache] TTS cache ready ({self.db_path})")
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
+
+    # ── Get / set ─────────────────────────────────────────────────────────────
+
+    def get(self, key: bytes) -> tuple[str, list] | None:
+        """Return (audio_b64, visemes) and mark the row as used. Blocking."""
+        if not self.enabled:
+            return None
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT audio_b64, visemes FROM tts_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE tts_cache SET used = ? WHERE key = ?", (time.time(), key)
+            )
+        return row[0], json.loads(row[1])
+
+    def set(self, key: bytes, audio_b64: str, visemes: list) -> None:
+        """Insert (or refresh) an entry; trims to max_entries now and then. Blocking."""
+        if not self.enabled or not audio_b64:
+            return
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tts_cache (key, audio_b64, visemes, used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, audio_b64, json.dumps(visemes), time.time()),
+            )
+            self._inserts += 1
+            if self._inserts % self.trim_every == 0:
+                self._conn.execute(
+                    "DELETE FROM tts_cache WHERE key NOT IN "
+                    "(SELECT key FROM tts_cache ORDER BY used DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
@@ -3,6 +3,8 @@ Convert ElevenLabs character alignment to Oculus-style viseme keyframes.
 Maps characters to visemes for lip-sync (mouthOpen/jaw driven from intensity).
 """
 
+import numpy as np
+
 VISEME_SIL = "sil"
 VISEMES = [
     "sil", "PP", "FF", "TH", "DD", "kk", "CH", "SS", "nn", "RR",
@@ -10,7 +12,7 @@ VISEMES = [
 ]
 
 
-def _char_to_viseme(c: str) -> str:
+def _slow_char_to_viseme(c: str) -> str:
     if not c or c == " ":
         return VISEME_SIL
     ch = c.lower()
@@ -49,6 +51,37 @@ def _char_to_viseme(c: str) -> str:
     return VISEME_SIL
 
 
+# ASCII fast path: one list index per character instead of the cascade above
+_ASCII_VISEME = [_slow_char_to_viseme(chr(o)) for o in range(128)]
+
+
+def _char_to_viseme(c: str) -> str:
+    if len(c) == 1:
+        o = ord(c)
+        if o < 128:
+            return _ASCII_VISEME[o]
+    return _slow_char_to_viseme(c)
+
+
+# Same table as small int codes (index into VISEMES) for the vectorised path
+_VISEME_CODE = {v: i for i, v in enumerate(VISEMES)}
+_SIL_CODE = _VISEME_CODE[VISEME_SIL]
+_LUT = np.array([_VISEME_CODE[v] for v in _ASCII_VISEME], dtype=np.int8)
+
+
+def _viseme_codes(characters: list[str]) -> np.ndarray:
+    text = "".join(characters)
+    if len(text) == len(characters) and text.isascii():
+        # One alignment entry per ASCII char — the usual English case
+        return _LUT[np.frombuffer(text.encode("ascii"), dtype=np.uint8)]
+    return np.array([_VISEME_CODE[_char_to_viseme(c)] for c in characters], dtype=np.int8)
+
+
+def _change_points(codes: np.ndarray) -> np.ndarray:
+    """Indices where the viseme code differs from the previous one."""
+    return np.flatnonzero(np.diff(codes, prepend=-1) != 0)
+
+
 def alignment_to_visemes(alignment: dict) -> list[dict]:
     """
     Build viseme keyframes from ElevenLabs alignment.
@@ -67,24 +100,45 @@ def alignment_to_visemes(alignment: dict) -> list[dict]:
     starts = alignment.get("character_start_times_seconds") or []
     ends = alignment.get("character_end_times_seconds") or []
 
-    seen: dict[float, dict] = {}
+    n = len(characters)
+    codes = _viseme_codes(characters)
 
-    for i, c in enumerate(characters):
-        viseme = _char_to_viseme(c)
-        start = starts[i] if i < len(starts) else 0.0
-        end = ends[i] if i < len(ends) else start + 0.05
-        intensity = 0 if viseme == VISEME_SIL else 1.0
+    # Pad missing timings the same way as before: start 0, end start + 50 ms
+    s = np.zeros(n, dtype=np.float64)
+    k = min(n, len(starts))
+    s[:k] = starts[:k]
+    e = s + 0.05
+    k = min(n, len(ends))
+    e[:k] = ends[:k]
+    mid = (s + e) * 0.5
 
-        if start not in seen:
-            seen[start] = {"viseme": viseme, "intensity": intensity}
-        elif viseme != VISEME_SIL:
-            seen[start] = {"viseme": viseme, "intensity": intensity}
+    # One keyframe pair per run of the same viseme (start + mid of its first
+    # character), plus the mid of its last character. Clients blend intensity
+    # from one keyframe to the next, so that closing keyframe is what holds
+    # the mouth shape through the run instead of fading across it.
+    idx  = _change_points(codes)
+    last = np.empty_like(idx)
+    last[:-1] = idx[1:] - 1
+    last[-1]  = n - 1
 
-        mid = (start + end) / 2
-        if mid not in seen:
-            seen[mid] = {"viseme": viseme, "intensity": intensity}
+    keyframes: list[dict] = []
+    for code, start, m, end_m, held in zip(
+        codes[idx].tolist(),
+        s[idx].tolist(),
+        mid[idx].tolist(),
+        mid[last].tolist(),
+        (last > idx).tolist(),
+    ):
+        viseme = VISEMES[code]
+        intensity = 0.0 if code == _SIL_CODE else 1.0
+        keyframes.append({"time": start, "viseme": viseme, "intensity": intensity})
+        keyframes.append({"time": m, "viseme": viseme, "intensity": intensity})
+        if held:
+            keyframes.append({"time": end_m, "viseme": viseme, "intensity": intensity})
 
-    keyframes = [{"time": t, "viseme": v["viseme"], "intensity": v["intensity"]} for t, v in sorted(seen.items())]
+    # Padded (missing) start times are 0.0 and land out of order — sort.
+    # Already-ordered input is a single linear pass for timsort.
+    keyframes.sort(key=lambda x: x["time"])
 
     if keyframes and keyframes[0]["time"] > 0:
         keyframes.insert(0, {"time": 0.0, "viseme": VISEME_SIL, "intensity": 0.0})
@@ -92,4 +146,4 @@ def alignment_to_visemes(alignment: dict) -> list[dict]:
         last = keyframes[-1]
         keyframes.append({"time": last["time"] + 0.1, "viseme": VISEME_SIL, "intensity": 0.0})
 
-    return sorted(keyframes, key=lambda x: x["time"])
+    return keyframes
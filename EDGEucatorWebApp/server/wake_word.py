@@ -9,7 +9,7 @@ Usage (started automatically by main.py):
         access_key = PICO_ACCESS_KEY,
         model_path  = "path/to/Harry-Potter_en_mac_v3_0_0.ppn",
         callback    = state_manager.trigger_wake_word,
-        broadcast   = broadcast_fn,   # async coroutine to push event to WS clients
+        broadcast   = broadcast_fn,   # async coroutine to push JSON bytes to WS clients
         loop        = asyncio_loop,
     )
     engine.start()
@@ -21,8 +21,24 @@ import asyncio
 import logging
 import threading
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+try:
+    import pvporcupine
+    from pvrecorder import PvRecorder
+    _HAS_PV = True
+except ImportError:
+    _HAS_PV = False
+
+# 16 × 512-sample frames at 16 kHz ≈ 0.5 s worst-case stop latency
+FRAMES_PER_STOP_CHECK = 16
+
+# Sent on every detection — serialised once here, never on the event loop
+_WAKE_PAYLOAD = {"event": "wake_word", "keyword": "Harry Potter"}
+_WAKE_MESSAGE = orjson.dumps(_WAKE_PAYLOAD)
+
 
 class WakeWordEngine:
     """
@@ -33,9 +49,10 @@ class WakeWordEngine:
     access_key  : Picovoice console access key.
     model_path  : Absolute path to the .ppn keyword file.
     callback    : Synchronous callable invoked on each detection
-                  (e.g. state_manager.trigger_wake_word).
-    broadcast   : Optional async coroutine ``broadcast(payload: dict)``
-                  for pushing wake-word events over WebSocket.
+                  (e.g. state_manager.trigger_wake_word). Runs on ``loop``
+                  when one is given, so it never races request handlers.
+    broadcast   : Optional async coroutine ``broadcast(buf: bytes)`` taking
+                  an already-serialised JSON message to push over WebSocket.
     loop        : The running asyncio event loop (needed to schedule
                   the async broadcast from the sync thread).
     """
@@ -53,21 +70,27 @@ class WakeWordEngine:
         self.callback    = callback
         self.broadcast   = broadcast
         self.loop        = loop
-        self._stop       = threading.Event()
+        self._stopped    = False               # checked once per batch of frames
         self._thread: threading.Thread | None = None
 
     # ── Public API ────────────────────────────────────────────────────────────
 
     def start(self) -> None:
         """Spawn the background detection thread."""
-        self._stop.clear()
+        if not _HAS_PV:
+            logger.error(
+                "[wake_word] pvporcupine / pvrecorder not installed. "
+                "Run: pip install pvporcupine pvrecorder"
+            )
+            return
+        self._stopped = False
         self._thread = threading.Thread(target=self._run, daemon=True, name="wake-word")
         self._thread.start()
         logger.info("[wake_word] Engine started — listening for 'Harry Potter'")
 
     def stop(self) -> None:
         """Signal the thread to stop and wait for it."""
-        self._stop.set()
+        self._stopped = True
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=3)
         logger.info("[wake_word] Engine stopped.")
@@ -75,16 +98,6 @@ class WakeWordEngine:
     # ── Internal ──────────────────────────────────────────────────────────────
 
     def _run(self) -> None:
-        try:
-            import pvporcupine
-            from pvrecorder import PvRecorder
-        except ImportError:
-            logger.error(
-                "[wake_word] pvporcupine / pvrecorder not installed. "
-                "Run: pip install pvporcupine pvrecorder"
-            )
-            return
-
         porcupine = None
         recorder  = None
 
@@ -100,18 +113,22 @@ class WakeWordEngine:
             recorder.start()
             logger.info("[wake_word] Microphone open — waiting for wake word…")
 
-            while not self._stop.is_set():
-                pcm    = recorder.read()
-                result = porcupine.process(pcm)
+            read, process = recorder.read, porcupine.process
+            while not self._stopped:
+                # Check the stop flag once per batch, not every 32 ms frame
+                for _ in range(FRAMES_PER_STOP_CHECK):
+                    if process(read()) < 0:
+                        continue
 
-                if result >= 0:
                     logger.info("[wake_word] 🧙 'Harry Potter' detected!")
-                    self.callback()                    # sync: set state flag
+                    if self.loop:                      # set state flag on the loop thread
+                        self.loop.call_soon_threadsafe(self.callback)
+                    else:
+                        self.callback()
 
                     if self.broadcast and self.loop:   # async: push WS event
                         asyncio.run_coroutine_threadsafe(
-                            self.broadcast({"event": "wake_word", "keyword": "Harry Potter"}),
-                            self.loop,
+                            self.broadcast(_WAKE_MESSAGE), self.loop
                         )
 
         except Exception:
@@ -48,6 +48,35 @@ interface GesturePacket {
   reset:      boolean;
 }
 
+// Binary wire format — must match MODES / GESTURES / PACKET in gesture_server.py
+const MODES = ['NONE', 'PAN', 'ZOOM_IN', 'ZOOM_OUT', 'ROTATE_H', 'ROTATE_V', 'RESET'];
+const GESTURES = [
+  'None', 'Closed_Fist', 'Open_Palm', 'Pointing_Up',
+  'Thumb_Down', 'Thumb_Up', 'Victory', 'ILoveYou',
+];
+const FLAG_ACTIVE  = 0x01;
+const FLAG_RESET   = 0x02;
+const LINEAR_SCALE = 10000;
+const ANGLE_SCALE  = 100;
+
+/** Decode one 14-byte packet: u8 mode, u8 gesture, u8 flags, 5×i16 deltas, u8 confidence. */
+function decodePacket(buf: ArrayBuffer): GesturePacket {
+  const v     = new DataView(buf);
+  const flags = v.getUint8(2);
+  return {
+    mode:       MODES[v.getUint8(0)] ?? 'NONE',
+    gesture:    GESTURES[v.getUint8(1)] ?? 'None',
+    active:     (flags & FLAG_ACTIVE) !== 0,
+    reset:      (flags & FLAG_RESET) !== 0,
+    dPanX:      v.getInt16(3,  true) / LINEAR_SCALE,
+    dPanY:      v.getInt16(5,  true) / LINEAR_SCALE,
+    dTheta:     v.getInt16(7,  true) / ANGLE_SCALE,
+    dPhi:       v.getInt16(9,  true) / ANGLE_SCALE,
+    dRadius:    v.getInt16(11, true) / LINEAR_SCALE,
+    confidence: v.getUint8(13) / 255,
+  };
+}
+
 interface GestureControllerProps {
   gestureRef: React.MutableRefObject<GestureTargets>;
   enabled:    boolean;
@@ -74,6 +103,7 @@ export function GestureController({ gestureRef, enabled }: GestureControllerProp
 
     setStatus('connecting');
     const ws = new WebSocket(WS_URL);
+    ws.binaryType = 'arraybuffer';
     wsRef.current = ws;
 
     ws.onopen = () => {
@@ -82,7 +112,7 @@ export function GestureController({ gestureRef, enabled }: GestureControllerProp
     };
 
     ws.onmessage = ({ data }: MessageEvent) => {
-      const pkt = JSON.parse(data) as GesturePacket;
+      const pkt = decodePacket(data as ArrayBuffer);
       const g   = gestureRef.current;
 
       g.mode = pkt.mode as GestureMode;